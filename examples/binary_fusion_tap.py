@@ -9,7 +9,7 @@ This demonstrates basic binary manipulation operations:
 - XOR (extracting difference bits)
 """
 
-def binary_fusion_tap(k: int) -> dict:
+def binary_fusion_tap(k: int, include_binary: bool = True) -> dict:
     """
     Generate binary tap operation with bit-shifting and XOR extraction.
 
@@ -21,12 +21,28 @@ def binary_fusion_tap(k: int) -> dict:
 
     Args:
         k: Offset parameter (recommended: 11 for this application)
+        include_binary: Include bin() strings of the seed, result and
+            difference bits (default: True). Callers that only need the
+            integer values can pass False to skip the string formatting.
 
     Returns:
         Dictionary with transformation data
+
+    Raises:
+        ValueError: If k is less than 1 (the digit sequence would be empty)
     """
+    if k < 1:
+        raise ValueError(f"k must be a positive integer, got {k}")
+
     # 1. Generate seed from concatenated digit sequence
-    seed_val = int("".join(map(str, range(1, k + 1))))
+    # Appending i shifts the accumulator left by i's decimal width; scale
+    # tracks that power of ten so no intermediate strings are built.
+    seed_val = 0
+    scale = 10
+    for i in range(1, k + 1):
+        if i == scale:
+            scale *= 10
+        seed_val = seed_val * scale + i
 
     # 2. Apply bit-shift left by 3 (equivalent to multiplying by 8)
     shifted_val = seed_val << 3
@@ -37,19 +53,21 @@ def binary_fusion_tap(k: int) -> dict:
     # 4. Extract difference bits using XOR
     # For k < 10, no extraction is needed
     # For k >= 10, XOR reveals the bits added by the offset
-    if k < 10:
-        diff_bits = 0
-    else:
-        diff_bits = result ^ (seed_val * 8)
+    # -(k >= 10) is an all-ones mask for k >= 10 and zero otherwise
+    diff_bits = (result ^ shifted_val) & -(k >= 10)
 
-    return {
+    data = {
         "k": k,
         "seed_value": seed_val,
-        "binary_seed": bin(seed_val),
-        "tap_state": bin(result),
-        "zpe_overflow": bin(diff_bits),  # Kept for backward compatibility
-        "zpe_overflow_decimal": diff_bits  # Kept for backward compatibility
     }
+    if include_binary:
+        data["binary_seed"] = bin(seed_val)
+        data["tap_state"] = bin(result)
+        data["zpe_overflow"] = bin(diff_bits)  # Kept for backward compatibility
+    data["tap_state_decimal"] = result
+    data["zpe_overflow_decimal"] = diff_bits  # Kept for backward compatibility
+
+    return data
 
 
 # Example usage
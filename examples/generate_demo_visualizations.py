@@ -20,6 +20,9 @@ Requirements:
 import sys
 import os
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -45,6 +48,33 @@ except ImportError:
     sys.exit(1)
 
 
+def _read_field(generator, width, height):
+    """
+    Read a height x width uint8 field from the stream.
+
+    Each row consumes ceil(width / 16) outputs of 16 bytes and keeps the
+    first `width` bytes, so the field matches a row-by-row fill.
+
+    Args:
+        generator: UniversalQKD stream to read from
+        width: Field width in pixels
+        height: Field height in pixels
+
+    Returns:
+        2D numpy array of stream bytes (0-255)
+    """
+    row_chunks = (width + 15) // 16
+    buf = b''.join(islice(generator, height * row_chunks))
+    return _bytes_to_field(buf, width, height)
+
+
+def _bytes_to_field(buf, width, height):
+    """Reshape joined 16-byte stream outputs into a height x width field."""
+    row_chunks = (width + 15) // 16
+    rows = np.frombuffer(buf, dtype=np.uint8).reshape(height, row_chunks * 16)
+    return rows[:, :width].copy()
+
+
 def generate_noise_field(width=256, height=256, seed_offset=0):
     """
     Generate a 2D noise field using GoldenSeed.
@@ -57,23 +87,51 @@ def generate_noise_field(width=256, height=256, seed_offset=0):
     Returns:
         2D numpy array of noise values (0-255)
     """
+    generator = UniversalQKD(offset=seed_offset)
+
+    # Generate noise field
+    return _read_field(generator, width, height)
+
+
+def generate_noise_fields(width, height, seed_offsets):
+    """
+    Generate noise fields for several seed offsets from a single stream.
+
+    Gives the same fields as calling generate_noise_field() once per offset,
+    but the stream is walked only once, up to the largest offset plus one
+    field, and outputs shared by overlapping fields are read once.
+
+    Args:
+        width: Field width in pixels
+        height: Field height in pixels
+        seed_offsets: Iterable of seed offsets
+
+    Returns:
+        List of 2D numpy arrays, in the order of seed_offsets
+    """
+    field_chunks = height * ((width + 15) // 16)
     generator = UniversalQKD()
 
-    # Skip to seed offset
-    for _ in range(seed_offset):
-        next(generator)
+    # window holds consecutive stream outputs starting at window_start
+    window = []
+    window_start = 0
+    fields = {}
 
-    # Generate noise field
-    field = np.zeros((height, width), dtype=np.uint8)
+    for offset in sorted(set(seed_offsets)):
+        window_end = window_start + len(window)
+        if offset >= window_end:
+            # Discard outputs up to the offset without keeping them
+            next(islice(generator, offset - window_end, offset - window_end), None)
+            window = []
+        else:
+            window = window[offset - window_start:]
+        window_start = offset
 
-    for y in range(height):
-        for x in range(0, width, 16):  # Process 16 pixels at a time
-            chunk = next(generator)
-            for i in range(min(16, width - x)):
-                if x + i < width:
-                    field[y, x + i] = chunk[i]
+        window.extend(islice(generator, field_chunks - len(window)))
+        fields[offset] = _bytes_to_field(b''.join(window[:field_chunks]),
+                                         width, height)
 
-    return field
+    return [fields[offset] for offset in seed_offsets]
 
 
 def generate_terrain_heightmap(width=256, height=256, seed_offset=0):
@@ -88,26 +146,15 @@ def generate_terrain_heightmap(width=256, height=256, seed_offset=0):
     Returns:
         2D array representing terrain elevation
     """
-    generator = UniversalQKD()
-
-    for _ in range(seed_offset):
-        next(generator)
-
-    # Generate base heightmap
-    heightmap = np.zeros((height, width), dtype=np.float32)
+    generator = UniversalQKD(offset=seed_offset)
 
-    # Multi-octave generation for more natural terrain
+    # Multi-octave generation for more natural terrain: read every octave's
+    # layer in one pass and combine them with amplitudes 1, 1/2, 1/4, ...
     octaves = 3
-    for octave in range(octaves):
-        scale = 2 ** octave
-        amplitude = 1.0 / scale
-
-        for y in range(height):
-            for x in range(0, width, 16):
-                chunk = next(generator)
-                for i in range(min(16, width - x)):
-                    if x + i < width:
-                        heightmap[y, x + i] += chunk[i] * amplitude
+    layers = _read_field(generator, width, height * octaves)
+    layers = layers.reshape(octaves, height, width).astype(np.float32)
+    amplitudes = 1.0 / (2.0 ** np.arange(octaves, dtype=np.float32))
+    heightmap = (layers * amplitudes[:, None, None]).sum(axis=0)
 
     # Normalize to 0-1
     heightmap = (heightmap - heightmap.min()) / (heightmap.max() - heightmap.min())
@@ -127,23 +174,12 @@ def generate_color_pattern(width=256, height=256, seed_offset=0):
     Returns:
         RGB image array
     """
-    generator = UniversalQKD()
-
-    for _ in range(seed_offset):
-        next(generator)
+    generator = UniversalQKD(offset=seed_offset)
 
-    # Generate RGB channels separately
-    image = np.zeros((height, width, 3), dtype=np.uint8)
+    # Generate RGB channels separately (one full plane per channel)
+    planes = _read_field(generator, width, height * 3).reshape(3, height, width)
 
-    for channel in range(3):
-        for y in range(height):
-            for x in range(0, width, 16):
-                chunk = next(generator)
-                for i in range(min(16, width - x)):
-                    if x + i < width:
-                        image[y, x + i, channel] = chunk[i]
-
-    return image
+    return np.ascontiguousarray(planes.transpose(1, 2, 0))
 
 
 def create_static_demos(output_dir):
@@ -214,6 +250,17 @@ def create_static_demos(output_dir):
     plt.close()
 
 
+def _render_frames(field_fn, seed_offsets, width=256, height=256):
+    """
+    Compute animation frames for a list of seed offsets in parallel.
+
+    Every frame reads its own stream from scratch, so the frames are
+    independent and can be generated in worker processes.
+    """
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(partial(field_fn, width, height), seed_offsets))
+
+
 def create_animated_demos(output_dir):
     """Create animated GIF demonstrations."""
     print("Generating animated demos...")
@@ -222,15 +269,18 @@ def create_animated_demos(output_dir):
     print("  - Animated noise evolution...")
 
     fig, ax = plt.subplots(figsize=(8, 8))
+    ax.axis('off')
+
+    # Create the image and title once; each frame only swaps the pixel data
+    im = ax.imshow(np.zeros((256, 256), dtype=np.uint8), cmap='plasma',
+                   vmin=0, vmax=255)
+    title = ax.set_title('', fontsize=14, fontweight='bold')
+    frames = _render_frames(generate_noise_field, [f * 10 for f in range(30)])
 
     def update_noise(frame):
-        ax.clear()
-        noise = generate_noise_field(256, 256, seed_offset=frame * 10)
-        ax.imshow(noise, cmap='plasma')
-        ax.set_title(f'GoldenSeed Procedural Noise\nSeed Offset: {frame * 10}',
-                    fontsize=14, fontweight='bold')
-        ax.axis('off')
-        return ax,
+        im.set_data(frames[frame])
+        title.set_text(f'GoldenSeed Procedural Noise\nSeed Offset: {frame * 10}')
+        return im, title
 
     anim = FuncAnimation(fig, update_noise, frames=30, interval=100, blit=False)
     writer = PillowWriter(fps=10)
@@ -241,18 +291,21 @@ def create_animated_demos(output_dir):
     print("  - Animated terrain evolution...")
 
     fig, ax = plt.subplots(figsize=(8, 8))
+    ax.axis('off')
 
     colors = ['#1a5490', '#2b7bb9', '#b8a57a', '#5a8f4f', '#8b7355', '#ffffff']
     cmap = LinearSegmentedColormap.from_list('terrain', colors, N=256)
 
+    # Heightmaps are normalized to 0-1, so a fixed color range matches autoscaling
+    im = ax.imshow(np.zeros((256, 256), dtype=np.float32), cmap=cmap,
+                   vmin=0.0, vmax=1.0)
+    title = ax.set_title('', fontsize=14, fontweight='bold')
+    frames = _render_frames(generate_terrain_heightmap, [f * 50 for f in range(20)])
+
     def update_terrain(frame):
-        ax.clear()
-        terrain = generate_terrain_heightmap(256, 256, seed_offset=frame * 50)
-        im = ax.imshow(terrain, cmap=cmap)
-        ax.set_title(f'GoldenSeed Procedural Terrain\nSeed: {frame * 50}',
-                    fontsize=14, fontweight='bold')
-        ax.axis('off')
-        return ax,
+        im.set_data(frames[frame])
+        title.set_text(f'GoldenSeed Procedural Terrain\nSeed: {frame * 50}')
+        return im, title
 
     anim = FuncAnimation(fig, update_terrain, frames=20, interval=200, blit=False)
     writer = PillowWriter(fps=5)
@@ -263,15 +316,16 @@ def create_animated_demos(output_dir):
     print("  - Animated color patterns...")
 
     fig, ax = plt.subplots(figsize=(8, 8))
+    ax.axis('off')
+
+    im = ax.imshow(np.zeros((256, 256, 3), dtype=np.uint8))
+    title = ax.set_title('', fontsize=14, fontweight='bold')
+    frames = _render_frames(generate_color_pattern, [f * 100 for f in range(25)])
 
     def update_colors(frame):
-        ax.clear()
-        pattern = generate_color_pattern(256, 256, seed_offset=frame * 100)
-        ax.imshow(pattern)
-        ax.set_title(f'GoldenSeed Procedural Art\nSeed: {frame * 100}',
-                    fontsize=14, fontweight='bold')
-        ax.axis('off')
-        return ax,
+        im.set_data(frames[frame])
+        title.set_text(f'GoldenSeed Procedural Art\nSeed: {frame * 100}')
+        return im, title
 
     anim = FuncAnimation(fig, update_colors, frames=25, interval=150, blit=False)
     writer = PillowWriter(fps=8)
@@ -290,12 +344,13 @@ def create_comparison_demo(output_dir):
     seed_offsets = [0, 100, 500, 1000, 2000, 5000, 10000, 20000,
                     50000, 100000, 500000, 1000000]
 
-    for idx, seed_offset in enumerate(seed_offsets):
+    noise_fields = generate_noise_fields(128, 128, seed_offsets)
+
+    for idx, (seed_offset, noise) in enumerate(zip(seed_offsets, noise_fields)):
         row = idx // 4
         col = idx % 4
         ax = fig.add_subplot(gs[row, col])
 
-        noise = generate_noise_field(128, 128, seed_offset=seed_offset)
         ax.imshow(noise, cmap='twilight')
         ax.set_title(f'Seed {seed_offset:,}', fontsize=9, fontweight='bold')
         ax.axis('off')
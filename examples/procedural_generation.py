@@ -12,6 +12,9 @@ Usage in Game Engines:
 - Unreal: Adapt to C++ using the C++ examples in releases/
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
 from gq import UniversalQKD
 
 
@@ -32,11 +35,10 @@ class ProceduralWorldGenerator:
         Args:
             world_seed_offset: Unique identifier for this world (0-n)
         """
-        self.generator = UniversalQKD()
+        self.world_seed_offset = world_seed_offset
         
-        # Skip to world-specific position
-        for _ in range(world_seed_offset):
-            next(self.generator)
+        # Start the stream at the world-specific position
+        self.generator = UniversalQKD(offset=world_seed_offset)
     
     def generate_chunk(self, chunk_x, chunk_z):
         """
@@ -65,6 +67,10 @@ class ProceduralWorldGenerator:
         """
         Generate deterministic entity properties.
         
+        Each entity is read from its own absolute stream position
+        (world_seed_offset + spawn_id), so the same spawn_id always gives
+        the same entity regardless of earlier calls.
+        
         Args:
             entity_type: Type of entity (e.g., "monster", "npc", "item")
             spawn_id: Unique spawn identifier
@@ -72,11 +78,8 @@ class ProceduralWorldGenerator:
         Returns:
             Dictionary with entity properties
         """
-        # Skip to entity-specific position
-        for _ in range(spawn_id):
-            next(self.generator)
-        
-        entity_bytes = next(self.generator)
+        # Read the output at the entity-specific position
+        entity_bytes = next(UniversalQKD(offset=self.world_seed_offset + spawn_id))
         
         entity = {
             'type': entity_type,
@@ -93,10 +96,12 @@ class ProceduralWorldGenerator:
 
 
 class ProceduralLevelGenerator:
-    """Generate infinite procedural game levels."""
+    """
+    Generate infinite procedural game levels.
     
-    def __init__(self):
-        self.generator = UniversalQKD()
+    Each level reads its own stream position, so levels are independent of
+    one another and can be generated in any order or in parallel.
+    """
     
     def generate_level(self, level_number):
         """
@@ -108,21 +113,22 @@ class ProceduralLevelGenerator:
         Returns:
             Dictionary with level configuration
         """
-        # Skip to level-specific position
-        for _ in range((level_number - 1) * 100):
-            next(self.generator)
+        # Start a stream at the level-specific position
+        generator = UniversalQKD(offset=(level_number - 1) * 100)
         
-        # Generate multiple bytes for level properties
-        level_bytes = [next(self.generator) for _ in range(5)]
+        # Read five outputs (80 bytes) for level properties in one pass
+        level_bytes = b''.join(islice(generator, 5))
         
+        # Output i (bytes 16*i onward) supplies the i-th counted field from
+        # its first byte; layout_seed takes bytes 8-15 of output 0
         level = {
             'number': level_number,
-            'difficulty': sum(level_bytes[0]) % 10,
-            'enemy_count': sum(level_bytes[1]) % 50 + 5,
-            'treasure_count': sum(level_bytes[2]) % 20 + 1,
-            'trap_count': sum(level_bytes[3]) % 30,
-            'boss_health': sum(level_bytes[4]) * 100,
-            'layout_seed': int.from_bytes(level_bytes[0][:8], 'big'),
+            'difficulty': int.from_bytes(level_bytes[0:1], 'big') % 10,
+            'enemy_count': int.from_bytes(level_bytes[16:17], 'big') % 50 + 5,
+            'treasure_count': int.from_bytes(level_bytes[32:33], 'big') % 20 + 1,
+            'trap_count': int.from_bytes(level_bytes[48:49], 'big') % 30,
+            'boss_health': int.from_bytes(level_bytes[64:65], 'big') * 100,
+            'layout_seed': int.from_bytes(level_bytes[8:16], 'big'),
         }
         
         return level
@@ -172,9 +178,13 @@ def example_level_generation():
     print()
     
     level_gen = ProceduralLevelGenerator()
+    level_numbers = [1, 5, 10, 50]
+    
+    # Levels are independent, so generate them across processes
+    with ProcessPoolExecutor() as executor:
+        levels = list(executor.map(level_gen.generate_level, level_numbers))
     
-    for level_num in [1, 5, 10, 50]:
-        level = level_gen.generate_level(level_num)
+    for level_num, level in zip(level_numbers, levels):
         print(f"Level {level_num:3d}: "
               f"Difficulty={level['difficulty']}/10, "
               f"Enemies={level['enemy_count']}, "
@@ -46,52 +46,83 @@ class BinaryFusionCompiler:
         """Generate Python implementation."""
         return '''#!/usr/bin/env python3
 """
-Binary Fusion Tap - Python Implementation
-Quantum-inspired key generation using 8-fold Heartbeat and ZPE Overflow
+Binary Tap Operation - Python Implementation
+Deterministic key generation using bit-shifting and XOR operations
+
+This demonstrates basic binary manipulation operations:
+- Bit-shifting (multiplication by powers of 2)
+- Addition (introducing offset bits)
+- XOR (extracting difference bits)
 """
 
-def binary_fusion_tap(k: int) -> dict:
+def binary_fusion_tap(k: int, include_binary: bool = True) -> dict:
     """
-    Generate binary fusion tap with 8-fold heartbeat and ZPE overflow.
+    Generate binary tap operation with bit-shifting and XOR extraction.
+
+    This performs a simple mathematical transformation:
+    1. Create seed from digit sequence (1,2,3,...,k)
+    2. Shift bits left by 3 positions (multiply by 8)
+    3. Add offset parameter k
+    4. Use XOR to extract the bits contributed by k
 
     Args:
-        k: Tap parameter (recommended: 11 for optimal entropy)
+        k: Offset parameter (recommended: 11 for this application)
+        include_binary: Include bin() strings of the seed, result and
+            difference bits (default: True). Callers that only need the
+            integer values can pass False to skip the string formatting.
 
     Returns:
-        Dictionary with key generation data
-    """
-    # 1. Generate seed from concatenated sequence
-    seed_val = int("".join(map(str, range(1, k + 1))))
-
-    # 2. Apply 8-fold Heartbeat (bit-shift left by 3)
-    heartbeat_val = seed_val << 3
-
-    # 3. Add Phase Offset
-    manifested = heartbeat_val + k
+        Dictionary with transformation data
 
-    # 4. Extract ZPE Overflow
-    if k < 10:
-        overflow = 0
-    else:
-        overflow = manifested ^ (seed_val * 8)
-
-    return {
+    Raises:
+        ValueError: If k is less than 1 (the digit sequence would be empty)
+    """
+    if k < 1:
+        raise ValueError(f"k must be a positive integer, got {k}")
+
+    # 1. Generate seed from concatenated digit sequence
+    # Appending i shifts the accumulator left by i's decimal width; scale
+    # tracks that power of ten so no intermediate strings are built.
+    seed_val = 0
+    scale = 10
+    for i in range(1, k + 1):
+        if i == scale:
+            scale *= 10
+        seed_val = seed_val * scale + i
+
+    # 2. Apply bit-shift left by 3 (equivalent to multiplying by 8)
+    shifted_val = seed_val << 3
+
+    # 3. Add offset to shifted value
+    result = shifted_val + k
+
+    # 4. Extract difference bits using XOR
+    # For k < 10, no extraction is needed
+    # For k >= 10, XOR reveals the bits added by the offset
+    # -(k >= 10) is an all-ones mask for k >= 10 and zero otherwise
+    diff_bits = (result ^ shifted_val) & -(k >= 10)
+
+    data = {
         "k": k,
         "seed_value": seed_val,
-        "binary_seed": bin(seed_val),
-        "tap_state": bin(manifested),
-        "zpe_overflow": bin(overflow),
-        "zpe_overflow_decimal": overflow
     }
+    if include_binary:
+        data["binary_seed"] = bin(seed_val)
+        data["tap_state"] = bin(result)
+        data["zpe_overflow"] = bin(diff_bits)  # Kept for backward compatibility
+    data["tap_state_decimal"] = result
+    data["zpe_overflow_decimal"] = diff_bits  # Kept for backward compatibility
+
+    return data
 
 
 # Example usage
 if __name__ == "__main__":
     result = binary_fusion_tap(11)
-    print(f"K Parameter: {result['k']}")
+    print(f"Offset Parameter: {result['k']}")
     print(f"Seed Value: {result['seed_value']}")
-    print(f"Tap State: {result['tap_state']}")
-    print(f"ZPE Overflow: {result['zpe_overflow']}")
+    print(f"Result State: {result['tap_state']}")
+    print(f"Difference Bits: {result['zpe_overflow']}")
 '''
 
     def generate_javascript(self) -> str:
@@ -35,6 +35,8 @@ Example Usage:
 from .universal_qkd import (
     universal_qkd_generator as UniversalQKD,
     generate_keys as generate_universal_keys,
+    generate_bytes as generate_universal_bytes,
+    generate_blocks as generate_universal_blocks,
     HEX_SEED,
     EXPECTED_CHECKSUM,
     GOLDEN_RATIO,
@@ -76,6 +78,8 @@ from .watermark import (
 __all__ = [
     "UniversalQKD",
     "generate_universal_keys",
+    "generate_universal_bytes",
+    "generate_universal_blocks",
     "GQS1",
     "generate_gqs1_vectors",
     "HEX_SEED",
@@ -53,6 +53,9 @@ EXPECTED_CHECKSUM = "096412ca0482ab0f519bc0e4ded667475c45495047653a21aa11e2c7c57
 # Hex seed for initializing system state (iφ golden seed)
 HEX_SEED = "0000000000000000a8f4979b77e3f93fa8f4979b77e3f93fa8f4979b77e3f93f"
 
+# Translation table mapping bit values 0/1 to ASCII '0'/'1' for XOR folding
+_BIT_TO_ASCII = bytes.maketrans(b'\x00\x01', b'01')
+
 
 def verify_seed_checksum(seed: bytes) -> bool:
     """
@@ -87,6 +90,13 @@ def basis_match(byte: int) -> bool:
     return bit1 == bit2
 
 
+# Lookup tables for sifting a whole entropy block at once: _BASIS_MISMATCH
+# lists the byte values rejected by basis_match(), _SIFTED_BIT maps each byte
+# value to its bit 0
+_BASIS_MISMATCH = bytes(b for b in range(256) if not basis_match(b))
+_SIFTED_BIT = bytes(b & 1 for b in range(256))
+
+
 def collect_sifted_bits(state: bytes, counter: int) -> tuple[List[int], bytes, int]:
     """
     Collect 256 sifted bits using basis-matching quantum simulation.
@@ -98,7 +108,7 @@ def collect_sifted_bits(state: bytes, counter: int) -> tuple[List[int], bytes, i
     Returns:
         Tuple of (sifted_bits, final_state, final_counter)
     """
-    sifted_bits = []
+    sifted_bits = bytearray()
 
     while len(sifted_bits) < 256:
         # Concatenate state with counter as string
@@ -110,17 +120,11 @@ def collect_sifted_bits(state: bytes, counter: int) -> tuple[List[int], bytes, i
         state = entropy
         counter += 1
 
-        # Apply basis matching for each byte
-        for byte in entropy:
-            if basis_match(byte):
-                # Extract bit 0 as the sifted bit
-                sifted_bits.append(byte & 1)
+        # Apply basis matching for each byte: drop the bytes that fail
+        # basis_match() and map the rest to their bit 0, via lookup tables
+        sifted_bits += entropy.translate(_SIFTED_BIT, _BASIS_MISMATCH)
 
-                # Stop if we have enough bits
-                if len(sifted_bits) >= 256:
-                    break
-
-    return sifted_bits[:256], state, counter
+    return list(sifted_bits[:256]), state, counter
 
 
 def xor_fold_hardening(sifted_bits: List[int]) -> bytes:
@@ -136,21 +140,16 @@ def xor_fold_hardening(sifted_bits: List[int]) -> bytes:
     Returns:
         Hardened key (16 bytes = 128 bits)
     """
-    # XOR first half with second half
-    key_bits = []
-    for i in range(128):
-        bit = sifted_bits[i] ^ sifted_bits[i + 128]
-        key_bits.append(bit)
-
-    # Convert bits to bytes
-    key_bytes = bytearray()
-    for i in range(0, 128, 8):
-        byte = 0
-        for j in range(8):
-            byte = (byte << 1) | key_bits[i + j]
-        key_bytes.append(byte)
-
-    return bytes(key_bytes)
+    if len(sifted_bits) < 256:
+        raise ValueError(f"Expected 256 sifted bits, got {len(sifted_bits)}")
+
+    # Render the bits as an ASCII '0'/'1' string so each 128-bit half can be
+    # parsed as one integer; a single XOR then folds all 128 positions
+    bit_string = bytes(sifted_bits[:256]).translate(_BIT_TO_ASCII)
+    folded = int(bit_string[:128], 2) ^ int(bit_string[128:], 2)
+
+    # Convert to bytes (MSB first)
+    return folded.to_bytes(16, 'big')
 
 
 def universal_qkd_generator(seed_hex: str = HEX_SEED) -> Iterator[bytes]:
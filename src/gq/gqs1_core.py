@@ -117,11 +117,11 @@ def xor_fold_hardening(bits: bytes) -> bytes:
     """
     half_len = len(bits) // 2
     first_half = bits[:half_len]   # First 128 bits
-    second_half = bits[half_len:]  # Second 128 bits
+    second_half = bits[half_len:2 * half_len]  # Second 128 bits
     
-    # XOR the two halves byte by byte
-    hardened = bytes(a ^ b for a, b in zip(first_half, second_half))
-    return hardened
+    # XOR the two halves as single integers rather than byte by byte
+    hardened = int.from_bytes(first_half, 'big') ^ int.from_bytes(second_half, 'big')
+    return hardened.to_bytes(half_len, 'big')
 
 
 def generate_key(state: bytes, counter: int) -> tuple[bytes, bytes]:
@@ -143,11 +143,10 @@ def generate_key(state: bytes, counter: int) -> tuple[bytes, bytes]:
     # Apply Hash-DRBG ratchet to get next state
     next_state = hash_drbg_ratchet(state, counter)
     
-    # Pass through for deterministic behavior (no probabilistic sifting)
-    output_bits = simulate_quantum_sifting(next_state)
-    
-    # Apply XOR folding to compress 256 bits to 128 bits
-    hardened_key = xor_fold_hardening(output_bits)
+    # Apply XOR folding to compress 256 bits to 128 bits. Sifting is a
+    # pass-through for deterministic behavior (see simulate_quantum_sifting),
+    # so the ratchet output is folded directly.
+    hardened_key = xor_fold_hardening(next_state)
     
     return hardened_key, next_state
 
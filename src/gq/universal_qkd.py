@@ -91,6 +91,9 @@ EXPECTED_CHECKSUM = "096412ca0482ab0f519bc0e4ded667475c45495047653a21aa11e2c7c57
 # Default hex seed (golden ratio - iφ)
 HEX_SEED = GOLDEN_RATIO_HEX
 
+# Translation table mapping bit values 0/1 to ASCII '0'/'1' for XOR folding
+_BIT_TO_ASCII = bytes.maketrans(b'\x00\x01', b'01')
+
 
 def verify_seed_checksum(seed: bytes) -> bool:
     """
@@ -134,6 +137,66 @@ def basis_match(byte: int) -> bool:
     return bit1 == bit2
 
 
+# Lookup tables for sifting a whole entropy block at once: _BASIS_MISMATCH
+# lists the byte values rejected by basis_match(), _SIFTED_BIT maps each byte
+# value to its bit 0
+_BASIS_MISMATCH = bytes(b for b in range(256) if not basis_match(b))
+_SIFTED_BIT = bytes(b & 1 for b in range(256))
+
+
+def _sift_block(state: bytes, counter: int) -> tuple[bytearray, bytes, int]:
+    """
+    Run the Layer 3 ratchet and sifting for one output.
+
+    This is the single implementation of the stream rule shared by
+    collect_sifted_bits(), advance_state() and generate_blocks().
+
+    Args:
+        state: Current system state (32 bytes)
+        counter: Current counter value
+
+    Returns:
+        Tuple of (sifted_bits, final_state, final_counter); sifted_bits holds
+        at least 256 bit values, of which only the first 256 are used
+    """
+    sifted_bits = bytearray()
+
+    while len(sifted_bits) < 256:
+        # Concatenate state with counter as UTF-8 string
+        counter_str = str(counter).encode('utf-8')
+        data = state + counter_str
+
+        # Generate entropy and progress state
+        entropy = hashlib.sha256(data).digest()
+        state = entropy
+        counter += 1
+
+        # Apply basis matching check for each byte: drop the bytes that fail
+        # basis_match() and map the rest to their bit 0, via lookup tables
+        sifted_bits += entropy.translate(_SIFTED_BIT, _BASIS_MISMATCH)
+
+    return sifted_bits, state, counter
+
+
+def _fold(sifted_bits: bytes | bytearray) -> bytes:
+    """
+    Apply the Layer 4 XOR fold to the first 256 sifted bit values.
+
+    Args:
+        sifted_bits: At least 256 bit values (each byte is 0 or 1)
+
+    Returns:
+        Output bytes (16 bytes = 128 bits)
+    """
+    # Render the bits as an ASCII '0'/'1' string so each 128-bit half can be
+    # parsed as one integer; a single XOR then folds all 128 positions
+    bit_string = sifted_bits[:256].translate(_BIT_TO_ASCII)
+    folded = int(bit_string[:128], 2) ^ int(bit_string[128:], 2)
+
+    # Convert to bytes (MSB first)
+    return folded.to_bytes(16, 'big')
+
+
 def collect_sifted_bits(state: bytes, counter: int) -> tuple[List[int], bytes, int]:
     """
     Collect 256 bits using basis-matching simulation.
@@ -157,29 +220,31 @@ def collect_sifted_bits(state: bytes, counter: int) -> tuple[List[int], bytes, i
     Returns:
         Tuple of (sifted_bits, final_state, final_counter)
     """
-    sifted_bits = []
+    sifted_bits, state, counter = _sift_block(state, counter)
+    return list(sifted_bits[:256]), state, counter
 
-    while len(sifted_bits) < 256:
-        # Concatenate state with counter as UTF-8 string
-        counter_str = str(counter).encode('utf-8')
-        data = state + counter_str
 
-        # Generate entropy and progress state
-        entropy = hashlib.sha256(data).digest()
-        state = entropy
-        counter += 1
+def advance_state(state: bytes, counter: int, steps: int) -> tuple[bytes, int]:
+    """
+    Advance the generator state past a number of outputs without producing them.
 
-        # Apply basis matching check for each byte
-        for byte in entropy:
-            if basis_match(byte):
-                # Extract bit 0 as the sifted bit
-                sifted_bits.append(byte & 1)
+    Runs the same ratchet and sifting as collect_sifted_bits() but skips
+    building the bit list and the XOR folding.
+    The result is the state and counter the generator would hold after
+    yielding `steps` outputs.
 
-                # Stop if we have enough bits
-                if len(sifted_bits) >= 256:
-                    break
+    Args:
+        state: Current system state (32 bytes)
+        counter: Current counter value
+        steps: Number of outputs to skip
 
-    return sifted_bits[:256], state, counter
+    Returns:
+        Tuple of (state, counter) after the skipped outputs
+    """
+    for _ in range(steps):
+        _, state, counter = _sift_block(state, counter)
+
+    return state, counter
 
 
 def xor_fold_hardening(sifted_bits: List[int]) -> bytes:
@@ -201,24 +266,39 @@ def xor_fold_hardening(sifted_bits: List[int]) -> bytes:
     Returns:
         Output bytes (16 bytes = 128 bits)
     """
-    # XOR first half with second half bit by bit
-    output_bits = []
-    for i in range(128):
-        bit = sifted_bits[i] ^ sifted_bits[i + 128]
-        output_bits.append(bit)
+    if len(sifted_bits) < 256:
+        raise ValueError(f"Expected 256 sifted bits, got {len(sifted_bits)}")
+
+    return _fold(bytes(sifted_bits[:256]))
+
+
+def _initial_state(seed_hex: str) -> bytes:
+    """
+    Verify the seed and derive the initial generator state from it.
 
-    # Convert bit list to bytes (8 bits per byte, MSB first)
-    output_bytes = bytearray()
-    for i in range(0, 128, 8):
-        byte = 0
-        for j in range(8):
-            byte = (byte << 1) | output_bits[i + j]
-        output_bytes.append(byte)
+    Args:
+        seed_hex: Hex string of the seed
+
+    Returns:
+        Initial state (32 bytes)
+
+    Raises:
+        ValueError: If seed checksum verification fails
+    """
+    seed = bytes.fromhex(seed_hex)
+
+    # Verify checksum for data integrity
+    if not verify_seed_checksum(seed):
+        raise ValueError(
+            f"Seed checksum verification failed. "
+            f"Expected: {EXPECTED_CHECKSUM}, "
+            f"Got: {hashlib.sha256(seed).hexdigest()}"
+        )
 
-    return bytes(output_bytes)
+    return hashlib.sha256(seed).digest()
 
 
-def universal_qkd_generator(seed_hex: str = HEX_SEED) -> Iterator[bytes]:
+def universal_qkd_generator(seed_hex: str = HEX_SEED, offset: int = 0) -> Iterator[bytes]:
     """
     Universal deterministic stream generator - infinite stream of 128-bit outputs.
 
@@ -240,28 +320,26 @@ def universal_qkd_generator(seed_hex: str = HEX_SEED) -> Iterator[bytes]:
 
     Args:
         seed_hex: Hex string of the seed (default: golden ratio)
+        offset: Number of leading outputs to skip (default: 0). The stream
+            starts at output `offset`, as if that many outputs had been
+            drawn and discarded, but without folding them.
 
     Yields:
         128-bit outputs as bytes (16 bytes each)
 
     Raises:
-        ValueError: If seed checksum verification fails
+        ValueError: If seed checksum verification fails or offset is negative
     """
-    # Initialize with seed
-    seed = bytes.fromhex(seed_hex)
-
-    # Verify checksum for data integrity
-    if not verify_seed_checksum(seed):
-        raise ValueError(
-            f"Seed checksum verification failed. "
-            f"Expected: {EXPECTED_CHECKSUM}, "
-            f"Got: {hashlib.sha256(seed).hexdigest()}"
-        )
+    if offset < 0:
+        raise ValueError(f"Offset must be non-negative, got {offset}")
 
-    # Layer 2: State Initialization
-    state = hashlib.sha256(seed).digest()
+    # Layers 1-2: Seed verification and state initialization
+    state = _initial_state(seed_hex)
     counter = 0
 
+    # Seek to the requested stream position
+    state, counter = advance_state(state, counter, offset)
+
     # Infinite stream
     while True:
         # Layer 3: Stream Generation with Basis Matching
@@ -294,6 +372,78 @@ def generate_keys(num_keys: int, seed_hex: str = HEX_SEED) -> List[str]:
     return outputs
 
 
+def generate_blocks(block_size: int, seed_hex: str = HEX_SEED,
+                    offset: int = 0) -> Iterator[bytes]:
+    """
+    Stream generator output in fixed-size blocks.
+
+    Concatenating the blocks gives exactly the bytes of
+    universal_qkd_generator(seed_hex, offset). Sifting and folding run in
+    one loop, which saves the generator resume per 16-byte output and the
+    list-to-bytes round-trip of collecting outputs one at a time. Large
+    streams can be consumed block by block without holding them in memory.
+
+    Args:
+        block_size: Number of bytes per block (need not be a multiple of 16)
+        seed_hex: Hex string of the seed (default: golden ratio)
+        offset: Number of leading outputs to skip (default: 0)
+
+    Yields:
+        Blocks of exactly block_size bytes
+
+    Raises:
+        ValueError: If seed checksum verification fails, block_size is not
+            positive or offset is negative
+    """
+    if block_size < 1:
+        raise ValueError(f"Block size must be positive, got {block_size}")
+    if offset < 0:
+        raise ValueError(f"Offset must be non-negative, got {offset}")
+
+    state, counter = advance_state(_initial_state(seed_hex), 0, offset)
+    buffer = bytearray()
+
+    while True:
+        while len(buffer) < block_size:
+            sifted_bits, state, counter = _sift_block(state, counter)
+            buffer += _fold(sifted_bits)
+
+        yield bytes(buffer[:block_size])
+        del buffer[:block_size]
+
+
+def generate_bytes(num_bytes: int, seed_hex: str = HEX_SEED, offset: int = 0) -> bytes:
+    """
+    Generate a block of stream bytes in a single call.
+
+    Produces the same bytes as joining successive outputs of
+    universal_qkd_generator(seed_hex, offset) and truncating to num_bytes,
+    using the bulk loop of generate_blocks().
+
+    Args:
+        num_bytes: Number of bytes to generate
+        seed_hex: Hex string of the seed (default: golden ratio)
+        offset: Number of leading outputs to skip (default: 0)
+
+    Returns:
+        Stream bytes of length num_bytes
+
+    Raises:
+        ValueError: If seed checksum verification fails, or num_bytes or
+            offset is negative
+    """
+    if num_bytes < 0:
+        raise ValueError(f"Number of bytes must be non-negative, got {num_bytes}")
+    if num_bytes == 0:
+        # Reject a bad offset or seed just as a non-empty request would
+        if offset < 0:
+            raise ValueError(f"Offset must be non-negative, got {offset}")
+        _initial_state(seed_hex)
+        return b''
+
+    return next(generate_blocks(num_bytes, seed_hex, offset))
+
+
 def main():
     """
     Main function for CLI interface.
@@ -26,9 +26,12 @@ from gq.universal_qkd import (
     verify_seed_checksum,
     basis_match,
     collect_sifted_bits,
+    advance_state,
     xor_fold_hardening,
     universal_qkd_generator,
     generate_keys,
+    generate_bytes,
+    generate_blocks,
 )
 
 
@@ -282,6 +285,71 @@ class TestUniversalQKD(unittest.TestCase):
         # All should be unique
         self.assertEqual(len(keys), 1000)
     
+    def test_generator_offset_matches_skipped_stream(self):
+        """Test that offset=n starts the stream at output n."""
+        generator = universal_qkd_generator()
+        keys = [next(generator) for _ in range(20)]
+
+        for offset in (0, 1, 7, 19):
+            gen = universal_qkd_generator(offset=offset)
+            self.assertEqual(next(gen), keys[offset])
+            if offset < 19:
+                self.assertEqual(next(gen), keys[offset + 1])
+
+    def test_generator_negative_offset_raises_error(self):
+        """Test that a negative offset is rejected."""
+        with self.assertRaises(ValueError):
+            next(universal_qkd_generator(offset=-1))
+
+    def test_advance_state_matches_collect_sifted_bits(self):
+        """Test that advance_state() tracks the full sifting ratchet."""
+        state = hashlib.sha256(self.seed).digest()
+        counter = 0
+        for _ in range(5):
+            _, state, counter = collect_sifted_bits(state, counter)
+
+        initial = hashlib.sha256(self.seed).digest()
+        self.assertEqual(advance_state(initial, 0, 5), (state, counter))
+        self.assertEqual(advance_state(initial, 0, 0), (initial, 0))
+
+    def test_generate_bytes_matches_generator(self):
+        """Test that generate_bytes() returns the joined generator stream."""
+        generator = universal_qkd_generator()
+        stream = b''.join(next(generator) for _ in range(12))
+
+        self.assertEqual(generate_bytes(len(stream)), stream)
+        self.assertEqual(generate_bytes(37), stream[:37])
+        self.assertEqual(generate_bytes(0), b'')
+        self.assertEqual(generate_bytes(32, offset=10), stream[160:192])
+
+    def test_generate_bytes_invalid_arguments(self):
+        """Test that generate_bytes() rejects bad sizes, offsets and seeds."""
+        with self.assertRaises(ValueError):
+            generate_bytes(-1)
+        with self.assertRaises(ValueError):
+            generate_bytes(16, offset=-1)
+        with self.assertRaises(ValueError):
+            generate_bytes(16, seed_hex="00" * 32)
+        with self.assertRaises(ValueError):
+            generate_bytes(0, offset=-1)
+        with self.assertRaises(ValueError):
+            generate_bytes(0, seed_hex="00" * 32)
+
+    def test_generate_blocks_concatenate_to_stream(self):
+        """Test that generate_blocks() splits the stream without gaps."""
+        stream = generate_bytes(16 * 20)
+
+        for block_size in (1, 16, 23, 64):
+            blocks = generate_blocks(block_size)
+            joined = b''.join(next(blocks) for _ in range(len(stream) // block_size))
+            self.assertEqual(joined, stream[:len(joined)])
+
+        blocks = generate_blocks(48, offset=5)
+        self.assertEqual(next(blocks) + next(blocks), stream[80:176])
+
+        with self.assertRaises(ValueError):
+            next(generate_blocks(0))
+
     def test_key_entropy_and_bias(self):
         """Test that generated keys have good entropy and no bias."""
         generator = universal_qkd_generator()